@@ -13,96 +13,168 @@ from pynonymizer.strategy.update_column import UpdateColumnStrategyTypes
 import copy
 import pytest
 
+SIMPLE_CONFIG = {
+    "tables": {
+        "accounts": {
+            "columns": {
+                "current_sign_in_ip": "ipv4_public",
+                "username": "unique_login",
+                "email": "unique_email",
+                "name": "empty",
+                "raw": "(NOW())",
+            }
+        },
+        "secrets": "delete",
+        "transactions": "truncate",
+    }
+}
+
+UNSUPPORTED_FAKE_TYPE_CONFIG = {
+    "tables": {
+        "accounts": {
+            "columns": {
+                "current_sign_in_ip": "ipv4_public",
+                "username": "unique_login",
+                "email": "NOT A VALID FAKE TYPE",
+                "name": "empty",
+            }
+        },
+        "transactions": "truncate",
+    }
+}
+
 
-@pytest.fixture
-def simple_config():
-    return {
-        "tables": {
-            "accounts": {
-                "columns": {
-                    "current_sign_in_ip": "ipv4_public",
-                    "username": "unique_login",
-                    "email": "unique_email",
-                    "name": "empty",
-                    "raw": "(NOW())",
-                }
+INVALID_TABLE_STRATEGY_CONFIG = {"tables": {"accounts": "cheesecake"}}
+
+INVALID_COLUMN_STRATEGY_CONFIG = {
+    "tables": {
+        "accounts": {
+            "columns": {
+                "current_sign_in_ip": {"type": "cheese"}
+            }  # Not a valid strategy
+        },
+        "transactions": "truncate",
+    }
+}
+
+BAD_DICT_TABLE_STRATEGY_CONFIG = {
+    "tables": {
+        "accounts": {
+            "not_columns": {
+                "current_sign_in_ip": "ipv4_public",
+                "username": "unique_login",
+                "email": "unique_email",
+                "name": "empty",
+            }
+        },
+    }
+}
+
+VERBOSE_TRUNCATE_WITH_COLUMNS_CONFIG = {
+    "tables": {
+        "table1": {
+            "type": "truncate",
+            # parser should raise error when keys from other types when type is specified
+            "columns": {},
+        }
+    }
+}
+
+UNRELATED_COLUMN_KEY_CONFIG = {
+    "tables": {
+        "table1": {
+            "type": "update_columns",
+            "columns": {
+                "column1": {
+                    "type": "empty",
+                    "where": "condition = 'value1'",
+                    "fake_type": "email",
+                },
             },
-            "secrets": "delete",
-            "transactions": "truncate",
         }
     }
-
-
-@pytest.fixture
-def config_unsupported_fake_type():
-    return {
-        "tables": {
-            "accounts": {
-                "columns": {
-                    "current_sign_in_ip": "ipv4_public",
-                    "username": "unique_login",
-                    "email": "NOT A VALID FAKE TYPE",
-                    "name": "empty",
-                }
+}
+
+VERBOSE_UPDATE_COLUMNS_CONFIG = {
+    "tables": {"table1": {"type": "update_columns", "columns": {}}}
+}
+
+VERBOSE_UPDATE_COLUMNS_WHERE_CONFIG = {
+    "tables": {
+        "table1": {
+            "type": "update_columns",
+            "columns": {
+                "column1": {"type": "empty", "where": "condition = 'value1'"},
+                "column2": {
+                    "type": "fake_update",
+                    "fake_type": "email",
+                    "where": "condition = 'value2'",
+                },
             },
-            "transactions": "truncate",
         }
     }
+}
 
-
-@pytest.fixture
-def fake_column_generator():
-    from pynonymizer.fake import FakeColumnGenerator
-
-    return FakeColumnGenerator()
+VERBOSE_TABLE_LIST_DUPLICATE_CONFIG = {
+    "tables": [
+        {
+            "table_name": "table1",
+            "type": "truncate",
+        },
+        {
+            "table_name": "table1",
+            "type": "truncate",
+        },
+    ]
+}
 
 
-@pytest.fixture
-def strategy_parser(fake_column_generator):
+@pytest.fixture(scope="module")
+def strategy_parser():
     from pynonymizer.strategy import parser
 
-    return parser.StrategyParser(fake_column_generator)
+    return parser.StrategyParser("en_GB")
 
 
-def test_valid_parse_no_mutate(simple_config, strategy_parser):
-    old_valid_config = copy.deepcopy(simple_config)
-    strategy_parser.parse_config(simple_config)
+def test_valid_parse_no_mutate(strategy_parser):
+    old_valid_config = copy.deepcopy(SIMPLE_CONFIG)
+    strategy_parser.parse_config(SIMPLE_CONFIG)
 
-    assert simple_config == old_valid_config
+    assert SIMPLE_CONFIG == old_valid_config
 
 
-def test_simple_parse_creates_databasestrategy(simple_config, strategy_parser):
-    strategy = strategy_parser.parse_config(simple_config)
+def test_simple_parse_creates_databasestrategy(strategy_parser):
+    strategy = strategy_parser.parse_config(SIMPLE_CONFIG)
 
     assert isinstance(strategy, database.DatabaseStrategy)
 
 
-def test_simple_parse_update_columns(simple_config, strategy_parser):
-    strategy = strategy_parser.parse_config(simple_config)
+def test_simple_parse_update_columns(strategy_parser):
+    strategy = strategy_parser.parse_config(SIMPLE_CONFIG)
 
     table = strategy.table_strategies[0]
     assert table.table_name == "accounts"
     assert table.strategy_type == TableStrategyTypes.UPDATE_COLUMNS
 
 
-def test_simple_parse_truncate(simple_config, strategy_parser):
-    strategy = strategy_parser.parse_config(simple_config)
+def test_simple_parse_truncate(strategy_parser):
+    strategy = strategy_parser.parse_config(SIMPLE_CONFIG)
 
     table = strategy.table_strategies[2]
     assert table.table_name == "transactions"
     assert table.strategy_type == TableStrategyTypes.TRUNCATE
 
 
-def test_simple_parse_delete(simple_config, strategy_parser):
-    strategy = strategy_parser.parse_config(simple_config)
+def test_simple_parse_delete(strategy_parser):
+    strategy = strategy_parser.parse_config(SIMPLE_CONFIG)
 
     table = strategy.table_strategies[1]
     assert table.table_name == "secrets"
     assert table.strategy_type == TableStrategyTypes.DELETE
 
 
-def test_simple_parse_columns(simple_config, strategy_parser):
-    strategy = strategy_parser.parse_config(simple_config)
+def test_simple_parse_columns(strategy_parser):
+    strategy = strategy_parser.parse_config(SIMPLE_CONFIG)
 
     table = strategy.table_strategies[0]
 
@@ -124,36 +196,21 @@ def test_simple_parse_columns(simple_config, strategy_parser):
     assert table.column_strategies[4].value == "(NOW())"
 
 
-def test_unsupported_fake_column_type(strategy_parser, config_unsupported_fake_type):
-    """
-    get_fake_column's UnsupportedFakeType should kill a parse attempt
-    """
-
-    with pytest.raises(UnsupportedFakeTypeError):
-        strategy_parser.parse_config(config_unsupported_fake_type)
-
-
-def test_invalid_table_strategy_parse(strategy_parser):
-    with pytest.raises(UnknownTableStrategyError):
-        strategy_parser.parse_config({"tables": {"accounts": "cheesecake"}})
-
-
-def test_unknown_column_strategy(strategy_parser):
-    with pytest.raises(UnknownColumnStrategyError):
-        strategy_parser.parse_config(
-            {
-                "tables": {
-                    "accounts": {
-                        "columns": {
-                            "current_sign_in_ip": {
-                                "type": "cheese"  # Not a valid strategy
-                            }
-                        }
-                    },
-                    "transactions": "truncate",
-                }
-            }
-        )
+@pytest.mark.parametrize(
+    "config,error",
+    [
+        # get_fake_column's UnsupportedFakeType should kill a parse attempt
+        (UNSUPPORTED_FAKE_TYPE_CONFIG, UnsupportedFakeTypeError),
+        (INVALID_TABLE_STRATEGY_CONFIG, UnknownTableStrategyError),
+        (INVALID_COLUMN_STRATEGY_CONFIG, UnknownColumnStrategyError),
+        (BAD_DICT_TABLE_STRATEGY_CONFIG, UnknownTableStrategyError),
+        (VERBOSE_TRUNCATE_WITH_COLUMNS_CONFIG, ConfigSyntaxError),
+        (UNRELATED_COLUMN_KEY_CONFIG, ConfigSyntaxError),
+    ],
+)
+def test_parse_errors(strategy_parser, config, error):
+    with pytest.raises(error):
+        strategy_parser.parse_config(config)
 
 
 def test_column_strategy_literal_containing_type(strategy_parser):
@@ -171,24 +228,6 @@ def test_column_strategy_literal_containing_type(strategy_parser):
     )
 
 
-def test_unknown_table_strategy_bad_dict(strategy_parser):
-    with pytest.raises(UnknownTableStrategyError):
-        strategy_parser.parse_config(
-            {
-                "tables": {
-                    "accounts": {
-                        "not_columns": {
-                            "current_sign_in_ip": "ipv4_public",
-                            "username": "unique_login",
-                            "email": "unique_email",
-                            "name": "empty",
-                        }
-                    },
-                }
-            }
-        )
-
-
 def test_valid_parse_before_after_script(strategy_parser):
     parse_result = strategy_parser.parse_config(
         {
@@ -215,75 +254,47 @@ def test_valid_parse_before_after_script(strategy_parser):
     ]
 
 
-def test_verbose_table_truncate(strategy_parser):
-    with pytest.raises(ConfigSyntaxError):
-        strategy = strategy_parser.parse_config(
-            {
-                "tables": {
-                    "table1": {
-                        "type": "truncate",
-                        # parser should raise error when keys from other types when type is specified
-                        "columns": {},
-                    }
-                }
-            }
-        )
-
-
-def test_verbose_table_update_columns(strategy_parser):
-    strategy = strategy_parser.parse_config(
-        {"tables": {"table1": {"type": "update_columns", "columns": {}}}}
-    )
-
-    assert len(strategy.table_strategies) == 1
-    assert strategy.table_strategies[0].table_name == "table1"
-    assert (
-        strategy.table_strategies[0].strategy_type == TableStrategyTypes.UPDATE_COLUMNS
-    )
-
-
-def test_verbose_table_list_duplicate(strategy_parser):
-    """parser should allow multiple tables of the same name in list-parse-mode"""
-    strategy = strategy_parser.parse_config(
-        {
-            "tables": [
-                {
-                    "table_name": "table1",
-                    "type": "truncate",
-                },
-                {
-                    "table_name": "table1",
-                    "type": "truncate",
-                },
-            ]
-        }
-    )
-
-    assert len(strategy.table_strategies) == 2
-    assert strategy.table_strategies[0].table_name == "table1"
-    assert strategy.table_strategies[0].strategy_type == TableStrategyTypes.TRUNCATE
-    assert strategy.table_strategies[1].table_name == "table1"
-    assert strategy.table_strategies[1].strategy_type == TableStrategyTypes.TRUNCATE
-
-
-def test_table_raises_when_given_unrelated_key(strategy_parser):
-    with pytest.raises(ConfigSyntaxError):
-        strategy_parser.parse_config(
-            {
-                "tables": {
-                    "table1": {
-                        "type": "update_columns",
-                        "columns": {
-                            "column1": {
-                                "type": "empty",
-                                "where": "condition = 'value1'",
-                                "fake_type": "email",
-                            },
-                        },
-                    }
-                }
-            }
-        )
+@pytest.mark.parametrize(
+    "config,expected_tables,expected_column_types",
+    [
+        (
+            VERBOSE_UPDATE_COLUMNS_CONFIG,
+            [("table1", TableStrategyTypes.UPDATE_COLUMNS)],
+            [],
+        ),
+        (
+            VERBOSE_UPDATE_COLUMNS_WHERE_CONFIG,
+            [("table1", TableStrategyTypes.UPDATE_COLUMNS)],
+            [UpdateColumnStrategyTypes.EMPTY, UpdateColumnStrategyTypes.FAKE_UPDATE],
+        ),
+        # parser should allow multiple tables of the same name in list-parse-mode
+        (
+            VERBOSE_TABLE_LIST_DUPLICATE_CONFIG,
+            [
+                ("table1", TableStrategyTypes.TRUNCATE),
+                ("table1", TableStrategyTypes.TRUNCATE),
+            ],
+            [],
+        ),
+    ],
+)
+def test_verbose_table_parse(
+    strategy_parser, config, expected_tables, expected_column_types
+):
+    strategy = strategy_parser.parse_config(config)
+
+    assert len(strategy.table_strategies) == len(expected_tables)
+    for table, (table_name, strategy_type) in zip(
+        strategy.table_strategies, expected_tables
+    ):
+        assert table.table_name == table_name
+        assert table.strategy_type == strategy_type
+
+    if expected_column_types:
+        column_strategies = strategy.table_strategies[0].column_strategies
+        assert [
+            column.strategy_type for column in column_strategies
+        ] == expected_column_types
 
 
 def test_locale_set_in_strategy_file_strategy_parse(strategy_parser):